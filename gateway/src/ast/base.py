@@ -23,6 +23,9 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger()
 
+# Item results per write: one BatchWriteItem request
+_ITEM_RESULT_BATCH_SIZE = 25
+
 
 class ASTStatus(Enum):
     """Status of an AST execution."""
@@ -137,6 +140,8 @@ class AST(ABC):
         self._cancelled = False
         self._db: Optional["DynamoDBClient"] = None
         self._session_id: str = ""
+        # Item results waiting for the next batch write
+        self._pending_item_results: list[tuple[str, dict[str, Any]]] = []
 
     def set_callbacks(
         self,
@@ -188,6 +193,10 @@ class AST(ABC):
         if self._cancelled:
             return False
 
+        if self._is_paused:
+            # Make finished items visible in history for the length of the pause
+            self._flush_item_results()
+
         # Wait for the pause event to be set (i.e., not paused)
         self._pause_event.wait(timeout=timeout)
 
@@ -338,7 +347,7 @@ class AST(ABC):
         error: Optional[str] = None,
         item_data: Optional[dict] = None,
     ) -> None:
-        """Save an item result to DynamoDB."""
+        """Queue an item result, writing the queue once a full batch is ready."""
         if not self._db:
             return
 
@@ -354,14 +363,38 @@ class AST(ABC):
         if item_data:
             data["policy_data"] = item_data
 
+        self._pending_item_results.append((item_id, data))
+        if len(self._pending_item_results) >= _ITEM_RESULT_BATCH_SIZE:
+            self._flush_item_results()
+
+    def _flush_item_results(self) -> None:
+        """Batch-write queued item results to DynamoDB."""
+        if not self._db or not self._pending_item_results:
+            return
+
+        pending, self._pending_item_results = self._pending_item_results, []
         try:
-            self._db.put_policy_result(
+            self._db.put_policy_results(
                 execution_id=self._execution_id,
-                policy_number=item_id,
-                data=data,
+                results=pending,
             )
-        except Exception as e:  # pragma: no cover - defensive logging
-            log.warning("Failed to save item result", item=item_id, error=str(e))
+        except Exception as e:
+            # One unwritable item fails the whole batch; retry individually so
+            # only that item is lost
+            log.warning(
+                "Batch save of item results failed", count=len(pending), error=str(e)
+            )
+            for item_id, data in pending:
+                try:
+                    self._db.put_policy_result(
+                        execution_id=self._execution_id,
+                        policy_number=item_id,
+                        data=data,
+                    )
+                except Exception as item_error:  # pragma: no cover - defensive logging
+                    log.warning(
+                        "Failed to save item result", item=item_id, error=str(item_error)
+                    )
 
     def _create_execution_record(
         self,
@@ -403,10 +436,12 @@ class AST(ABC):
         item_results: list[ItemResult],
         error: Optional[str] = None,
     ) -> None:
-        """Update execution record with final status."""
+        """Flush queued item results and update execution record with final status."""
         if not self._db:
             return
 
+        self._flush_item_results()
+
         try:
             updates: dict[str, Any] = {
                 "status": status,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Final
 
@@ -14,9 +15,17 @@ TESTS_DIR: Final = PROJECT_ROOT / "tests"
 SRC_DIR: Final = PROJECT_ROOT / "src"
 
 
+def _parallel_args() -> list[str]:
+    """Spread test files across CPU cores when pytest-xdist is installed."""
+    if find_spec("xdist") is None:
+        return []
+    # loadfile keeps each module in one worker; several tests reload modules
+    return ["-n", "auto", "--dist=loadfile"]
+
+
 def run_tests() -> None:
     """Execute the test suite using pytest."""
-    sys.exit(pytest.main([str(TESTS_DIR), "-v"]))
+    sys.exit(pytest.main([str(TESTS_DIR), "-v", *_parallel_args()]))
 
 
 def run_coverage() -> None:
@@ -25,6 +34,7 @@ def run_coverage() -> None:
         pytest.main([
             str(TESTS_DIR),
             "-v",
+            *_parallel_args(),
             f"--cov={SRC_DIR}",
             "--cov-report=html",
             "--cov-report=term-missing",
@@ -3,36 +3,73 @@
 # ============================================================================
 
 import os
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from typing import Any
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+def _read_env(env: Mapping[str, str], name: str, default: Any) -> Any:
+    """Read one variable from ``env``, coerced to the type of its default."""
+    raw = env.get(name)
+    if raw is None:
+        return default
+    if isinstance(default, bool):
+        return raw.lower() == "true"
+    if isinstance(default, int):
+        return int(raw)
+    return raw
+
+
+def _env_field(name: str, default: Any) -> Any:
+    """Dataclass field that defaults to environment variable ``name``."""
+    return field(
+        default_factory=lambda: _read_env(os.environ, name, default),
+        metadata={"env": name, "default": default},
+    )
+
+
+def _env_values(cls: type, env: Mapping[str, str]) -> dict[str, Any]:
+    """Collect values for every ``_env_field`` of ``cls`` from one mapping."""
+    return {
+        f.name: _read_env(env, f.metadata["env"], f.metadata["default"])
+        for f in fields(cls)
+        if "env" in f.metadata
+    }
+
+
 @dataclass(frozen=True)
 class DynamoDBConfig:
     """DynamoDB connection configuration."""
 
-    endpoint: str = field(
-        default_factory=lambda: os.getenv("DYNAMODB_ENDPOINT", "http://127.0.0.1:8042")
-    )
-    region: str = field(default_factory=lambda: os.getenv("AWS_REGION", "us-east-1"))
-    table_name: str = field(default_factory=lambda: os.getenv("DYNAMODB_TABLE", "terminal"))
-    access_key_id: str = field(default_factory=lambda: os.getenv("AWS_ACCESS_KEY_ID", "dummy"))
-    secret_access_key: str = field(
-        default_factory=lambda: os.getenv("AWS_SECRET_ACCESS_KEY", "dummy")
-    )
+    endpoint: str = _env_field("DYNAMODB_ENDPOINT", "http://127.0.0.1:8042")
+    region: str = _env_field("AWS_REGION", "us-east-1")
+    table_name: str = _env_field("DYNAMODB_TABLE", "terminal")
+    access_key_id: str = _env_field("AWS_ACCESS_KEY_ID", "dummy")
+    secret_access_key: str = _env_field("AWS_SECRET_ACCESS_KEY", "dummy")
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] = os.environ) -> "DynamoDBConfig":
+        """Build from the given environment mapping, falling back to the field defaults."""
+        return cls(**_env_values(cls, env))
 
 
 @dataclass(frozen=True)
 class ValkeyConfig:
     """Valkey/Redis connection configuration."""
 
-    host: str = field(default_factory=lambda: os.getenv("VALKEY_HOST", "localhost"))
-    port: int = field(default_factory=lambda: int(os.getenv("VALKEY_PORT", "6379")))
-    db: int = field(default_factory=lambda: int(os.getenv("VALKEY_DB", "0")))
-    password: str | None = field(default_factory=lambda: os.getenv("VALKEY_PASSWORD"))
+    host: str = _env_field("VALKEY_HOST", "localhost")
+    port: int = _env_field("VALKEY_PORT", 6379)
+    db: int = _env_field("VALKEY_DB", 0)
+    password: str | None = _env_field("VALKEY_PASSWORD", None)
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] = os.environ) -> "ValkeyConfig":
+        """Build from the given environment mapping, falling back to the field defaults."""
+        return cls(**_env_values(cls, env))
 
 
 @dataclass(frozen=True)
@@ -42,27 +79,39 @@ class TN3270Config:
     Uses IBM-3278-4-E model (80x43) by default.
     """
 
-    host: str = field(default_factory=lambda: os.getenv("TN3270_HOST", "localhost"))
-    port: int = field(default_factory=lambda: int(os.getenv("TN3270_PORT", "3270")))
+    host: str = _env_field("TN3270_HOST", "localhost")
+    port: int = _env_field("TN3270_PORT", 3270)
     # IBM-3278-4-E: 80 columns x 43 rows (fixed, does not resize)
-    cols: int = field(default_factory=lambda: int(os.getenv("TN3270_COLS", "80")))
-    rows: int = field(default_factory=lambda: int(os.getenv("TN3270_ROWS", "43")))
-    terminal_type: str = field(
-        default_factory=lambda: os.getenv("TN3270_TERMINAL_TYPE", "IBM-3278-4-E")
-    )
-    max_sessions: int = field(default_factory=lambda: int(os.getenv("TN3270_MAX_SESSIONS", "10")))
-    secure: bool = field(
-        default_factory=lambda: os.getenv("TN3270_SECURE", "false").lower() == "true"
-    )
+    cols: int = _env_field("TN3270_COLS", 80)
+    rows: int = _env_field("TN3270_ROWS", 43)
+    terminal_type: str = _env_field("TN3270_TERMINAL_TYPE", "IBM-3278-4-E")
+    max_sessions: int = _env_field("TN3270_MAX_SESSIONS", 10)
+    secure: bool = _env_field("TN3270_SECURE", False)
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] = os.environ) -> "TN3270Config":
+        """Build from the given environment mapping, falling back to the field defaults."""
+        return cls(**_env_values(cls, env))
 
 
 @dataclass(frozen=True)
 class Config:
     """Application configuration."""
 
-    valkey: ValkeyConfig = field(default_factory=ValkeyConfig)
-    tn3270: TN3270Config = field(default_factory=TN3270Config)
-    dynamodb: DynamoDBConfig = field(default_factory=DynamoDBConfig)
+    valkey: ValkeyConfig = field(default_factory=ValkeyConfig.from_env)
+    tn3270: TN3270Config = field(default_factory=TN3270Config.from_env)
+    dynamodb: DynamoDBConfig = field(default_factory=DynamoDBConfig.from_env)
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] | None = None) -> "Config":
+        """Build the full configuration from a single snapshot of the environment."""
+        if env is None:
+            env = dict(os.environ)
+        return cls(
+            valkey=ValkeyConfig.from_env(env),
+            tn3270=TN3270Config.from_env(env),
+            dynamodb=DynamoDBConfig.from_env(env),
+        )
 
 
 _config: Config | None = None
@@ -72,5 +121,5 @@ def get_config() -> Config:
     """Get application configuration (singleton)."""
     global _config
     if _config is None:
-        _config = Config()
+        _config = Config.from_env()
     return _config
@@ -17,8 +17,11 @@ GSI1: GSI1PK (email) for user lookup by email
 GSI2: GSI2PK (USER#<userId>#DATE#<date>), GSI2SK (started_at) for user's executions by date
 """
 
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 import boto3
 import structlog
@@ -43,6 +46,10 @@ class DynamoDBClient:
     DynamoDB client wrapper for single table design.
     """
 
+    # Shared pool for fanning out independent reads, created on first use
+    _read_executor: ClassVar[ThreadPoolExecutor | None] = None
+    _read_executor_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, config: DynamoDBConfig) -> None:
         self._table_name = config.table_name
         self._resource = boto3.resource(
@@ -60,6 +67,11 @@ class DynamoDBClient:
             aws_secret_access_key=config.secret_access_key,
         )
         self._table = self._resource.Table(config.table_name)  # type: ignore[attr-defined]
+        # The resource's own client serializes boto3 condition objects for paginators
+        resource_meta = self._resource.meta
+        if resource_meta is None:  # pragma: no cover - boto3 always attaches meta
+            raise RuntimeError("DynamoDB resource has no client")
+        self._resource_client = resource_meta.client
 
         # Validate connection by describing the table
         try:
@@ -76,6 +88,17 @@ class DynamoDBClient:
         """Get the table resource."""
         return self._table
 
+    @classmethod
+    def _get_read_executor(cls) -> ThreadPoolExecutor:
+        """Get the shared read executor, creating it on first use."""
+        if cls._read_executor is None:
+            with cls._read_executor_lock:
+                if cls._read_executor is None:
+                    cls._read_executor = ThreadPoolExecutor(
+                        max_workers=8, thread_name_prefix="dynamodb"
+                    )
+        return cls._read_executor
+
     # -------------------------------------------------------------------------
     # Generic Operations
     # -------------------------------------------------------------------------
@@ -84,6 +107,16 @@ class DynamoDBClient:
         """Put an item into the table."""
         self._table.put_item(Item=item)
 
+    def put_items(self, items: Iterable[dict[str, Any]]) -> None:
+        """Put many items via BatchWriteItem.
+
+        The batch writer sends up to 25 items per request and resends any
+        unprocessed items; a repeated PK/SK keeps its last item.
+        """
+        with self._table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+            for item in items:
+                batch.put_item(Item=item)
+
     def get_item(self, pk: str, sk: str) -> dict[str, Any] | None:
         """Get an item by primary key (PK + SK)."""
         response = self._table.get_item(Key={"PK": pk, "SK": sk})
@@ -123,46 +156,63 @@ class DynamoDBClient:
         """Delete an item by primary key."""
         self._table.delete_item(Key={"PK": pk, "SK": sk})
 
-    def query_pk(
+    def _iter_query(self, limit: int | None = None, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        """Yield query results lazily, following LastEvaluatedKey across pages."""
+        pagination: dict[str, Any] = {}
+        if limit:
+            pagination = {"MaxItems": limit, "PageSize": limit}
+
+        paginator = self._resource_client.get_paginator("query")
+        for page in paginator.paginate(
+            TableName=self._table_name, PaginationConfig=pagination, **kwargs
+        ):
+            yield from page.get("Items", [])
+
+    def iter_query_pk(
         self,
         pk: str,
         sk_prefix: str | None = None,
         limit: int | None = None,
-    ) -> list[dict[str, Any]]:
-        """Query items by PK, optionally filtering by SK prefix."""
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate items by PK across all pages, optionally filtering by SK prefix."""
         if sk_prefix:
             key_condition = Key("PK").eq(pk) & Key("SK").begins_with(sk_prefix)
         else:
             key_condition = Key("PK").eq(pk)
 
-        kwargs: dict[str, Any] = {"KeyConditionExpression": key_condition}
-        if limit:
-            kwargs["Limit"] = limit
+        return self._iter_query(limit, KeyConditionExpression=key_condition)
 
-        response = self._table.query(**kwargs)
-        return response.get("Items", [])
+    def query_pk(
+        self,
+        pk: str,
+        sk_prefix: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query items by PK, optionally filtering by SK prefix."""
+        return list(self.iter_query_pk(pk, sk_prefix=sk_prefix, limit=limit))
 
-    def query_gsi1(
+    def iter_query_gsi1(
         self,
         gsi1pk: str,
         sk_prefix: str | None = None,
         limit: int | None = None,
-    ) -> list[dict[str, Any]]:
-        """Query GSI1 by GSI1PK (e.g., email lookup)."""
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate GSI1 items by GSI1PK across all pages."""
         if sk_prefix:
             key_condition = Key("GSI1PK").eq(gsi1pk) & Key("SK").begins_with(sk_prefix)
         else:
             key_condition = Key("GSI1PK").eq(gsi1pk)
 
-        kwargs: dict[str, Any] = {
-            "IndexName": "GSI1",
-            "KeyConditionExpression": key_condition,
-        }
-        if limit:
-            kwargs["Limit"] = limit
+        return self._iter_query(limit, IndexName="GSI1", KeyConditionExpression=key_condition)
 
-        response = self._table.query(**kwargs)
-        return response.get("Items", [])
+    def query_gsi1(
+        self,
+        gsi1pk: str,
+        sk_prefix: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query GSI1 by GSI1PK (e.g., email lookup)."""
+        return list(self.iter_query_gsi1(gsi1pk, sk_prefix=sk_prefix, limit=limit))
 
     def query_gsi2(
         self,
@@ -204,8 +254,7 @@ class DynamoDBClient:
 
     def get_user_by_email(self, email: str) -> dict[str, Any] | None:
         """Get user profile by email (via GSI1)."""
-        items = self.query_gsi1(email, sk_prefix=KeyPrefix.PROFILE, limit=1)
-        return items[0] if items else None
+        return next(self.iter_query_gsi1(email, sk_prefix=KeyPrefix.PROFILE, limit=1), None)
 
     def put_user(self, user_id: str, email: str, data: dict[str, Any]) -> None:
         """Create or update a user."""
@@ -283,6 +332,41 @@ class DynamoDBClient:
         """Get all policy results for an execution."""
         return self.query_pk(f"{KeyPrefix.EXECUTION}{execution_id}", sk_prefix=KeyPrefix.POLICY)
 
+    def get_user_full_history(self, user_id: str) -> list[dict[str, Any]]:
+        """
+        Get all sessions for a user along with their executions and policy results.
+
+        Each session's executions and each execution's policies are independent
+        queries, so they are fanned out over the shared read executor instead of
+        being issued one round-trip at a time.
+
+        Returns:
+            The user's sessions, each with an "executions" list whose entries
+            carry a "policies" list.
+        """
+        executor = self._get_read_executor()
+        sessions = self.get_user_sessions(user_id)
+
+        session_futures: dict[Future[list[dict[str, Any]]], dict[str, Any]] = {
+            executor.submit(self.get_session_executions, session["session_id"]): session
+            for session in sessions
+        }
+        policy_futures: dict[Future[list[dict[str, Any]]], dict[str, Any]] = {}
+
+        for future in as_completed(session_futures):
+            executions = future.result()
+            session_futures[future]["executions"] = executions
+            for execution in executions:
+                policy_future = executor.submit(
+                    self.get_execution_policies, execution["execution_id"]
+                )
+                policy_futures[policy_future] = execution
+
+        for future in as_completed(policy_futures):
+            policy_futures[future]["policies"] = future.result()
+
+        return sessions
+
     def get_user_executions_by_date(
         self,
         user_id: str,
@@ -354,6 +438,22 @@ class DynamoDBClient:
         }
         self.put_item(item)
 
+    def put_policy_results(
+        self, execution_id: str, results: Iterable[tuple[str, dict[str, Any]]]
+    ) -> None:
+        """Create many policy result records in batches (see ``put_items``)."""
+        pk = f"{KeyPrefix.EXECUTION}{execution_id}"
+        self.put_items(
+            {
+                "PK": pk,
+                "SK": f"{KeyPrefix.POLICY}{policy_number}",
+                "execution_id": execution_id,
+                "policy_number": policy_number,
+                **data,
+            }
+            for policy_number, data in results
+        )
+
     def get_policy_result(self, execution_id: str, policy_number: str) -> dict[str, Any] | None:
         """Get a specific policy result."""
         return self.get_item(
@@ -4,6 +4,10 @@
 """
 Pydantic models for DynamoDB single table design.
 
+Items read back from the table were written by these models, so
+``from_dynamodb`` converts the few non-JSON types explicitly and hydrates
+with ``model_construct`` instead of re-running validation on every row.
+
 Table: terminal
 ===============
 PK                    SK                        Entity
@@ -32,6 +36,21 @@ class KeyPrefix:
     PROFILE = "PROFILE"
 
 
+# Bound once so key building is a plain str concatenation
+_USER_PREFIX = KeyPrefix.USER
+_SESSION_PREFIX = KeyPrefix.SESSION
+_EXECUTION_PREFIX = KeyPrefix.EXECUTION
+_POLICY_PREFIX = KeyPrefix.POLICY
+
+
+_FROMISO = datetime.fromisoformat
+
+
+def _fromiso_or_none(value: str | None) -> datetime | None:
+    """Parse an optional ISO timestamp attribute (missing/empty -> None)."""
+    return _FROMISO(value) if value else None
+
+
 class ExecutionStatus(str, Enum):
     """Status of an AST execution."""
 
@@ -53,6 +72,11 @@ class PolicyStatus(str, Enum):
     SKIPPED = "skipped"
 
 
+# Plain-str status values for item serialization
+_EXECUTION_STATUS_VALUES = {status: status.value for status in ExecutionStatus}
+_POLICY_STATUS_VALUES = {status: status.value for status in PolicyStatus}
+
+
 # ============================================================================
 # User Model
 # ============================================================================
@@ -69,7 +93,7 @@ class User(BaseModel):
     def to_dynamodb(self) -> dict[str, Any]:
         """Convert to DynamoDB item format (single table)."""
         return {
-            "PK": f"{KeyPrefix.USER}{self.user_id}",
+            "PK": _USER_PREFIX + self.user_id,
             "SK": KeyPrefix.PROFILE,
             "GSI1PK": self.email,  # For email lookup
             "user_id": self.user_id,
@@ -81,15 +105,11 @@ class User(BaseModel):
     @classmethod
     def from_dynamodb(cls, item: dict[str, Any]) -> "User":
         """Create from DynamoDB item."""
-        return cls(
+        return cls.model_construct(
             user_id=item["user_id"],
             email=item["email"],
-            created_at=datetime.fromisoformat(item["created_at"]),
-            updated_at=(
-                datetime.fromisoformat(item["updated_at"])
-                if item.get("updated_at")
-                else None
-            ),
+            created_at=_FROMISO(item["created_at"]),
+            updated_at=_fromiso_or_none(item.get("updated_at")),
         )
 
 
@@ -110,8 +130,8 @@ class Session(BaseModel):
     def to_dynamodb(self) -> dict[str, Any]:
         """Convert to DynamoDB item format (single table)."""
         return {
-            "PK": f"{KeyPrefix.USER}{self.user_id}",
-            "SK": f"{KeyPrefix.SESSION}{self.session_id}",
+            "PK": _USER_PREFIX + self.user_id,
+            "SK": _SESSION_PREFIX + self.session_id,
             "session_id": self.session_id,
             "user_id": self.user_id,
             "status": self.status,
@@ -122,12 +142,12 @@ class Session(BaseModel):
     @classmethod
     def from_dynamodb(cls, item: dict[str, Any]) -> "Session":
         """Create from DynamoDB item."""
-        return cls(
+        return cls.model_construct(
             session_id=item["session_id"],
             user_id=item["user_id"],
             status=item.get("status", "active"),
-            created_at=datetime.fromisoformat(item["created_at"]),
-            last_activity=datetime.fromisoformat(item["last_activity"]),
+            created_at=_FROMISO(item["created_at"]),
+            last_activity=_FROMISO(item["last_activity"]),
         )
 
 
@@ -155,12 +175,12 @@ class ASTExecution(BaseModel):
     def to_dynamodb(self) -> dict[str, Any]:
         """Convert to DynamoDB item format (single table)."""
         return {
-            "PK": f"{KeyPrefix.SESSION}{self.session_id}",
-            "SK": f"{KeyPrefix.EXECUTION}{self.execution_id}",
+            "PK": _SESSION_PREFIX + self.session_id,
+            "SK": _EXECUTION_PREFIX + self.execution_id,
             "execution_id": self.execution_id,
             "session_id": self.session_id,
             "ast_name": self.ast_name,
-            "status": self.status.value,
+            "status": _EXECUTION_STATUS_VALUES[self.status],
             "progress": self.progress,
             "total_items": self.total_items,
             "completed_items": self.completed_items,
@@ -176,7 +196,7 @@ class ASTExecution(BaseModel):
     @classmethod
     def from_dynamodb(cls, item: dict[str, Any]) -> "ASTExecution":
         """Create from DynamoDB item."""
-        return cls(
+        return cls.model_construct(
             execution_id=item["execution_id"],
             session_id=item["session_id"],
             ast_name=item["ast_name"],
@@ -187,12 +207,8 @@ class ASTExecution(BaseModel):
             params=item.get("params", {}),
             result=item.get("result"),
             error=item.get("error"),
-            started_at=datetime.fromisoformat(item["started_at"]),
-            completed_at=(
-                datetime.fromisoformat(item["completed_at"])
-                if item.get("completed_at")
-                else None
-            ),
+            started_at=_FROMISO(item["started_at"]),
+            completed_at=_fromiso_or_none(item.get("completed_at")),
         )
 
 
@@ -217,11 +233,11 @@ class PolicyResult(BaseModel):
     def to_dynamodb(self) -> dict[str, Any]:
         """Convert to DynamoDB item format (single table)."""
         return {
-            "PK": f"{KeyPrefix.EXECUTION}{self.execution_id}",
-            "SK": f"{KeyPrefix.POLICY}{self.policy_number}",
+            "PK": _EXECUTION_PREFIX + self.execution_id,
+            "SK": _POLICY_PREFIX + self.policy_number,
             "execution_id": self.execution_id,
             "policy_number": self.policy_number,
-            "status": self.status.value,
+            "status": _POLICY_STATUS_VALUES[self.status],
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": (
                 self.completed_at.isoformat() if self.completed_at else None
@@ -235,21 +251,15 @@ class PolicyResult(BaseModel):
     @classmethod
     def from_dynamodb(cls, item: dict[str, Any]) -> "PolicyResult":
         """Create from DynamoDB item."""
-        return cls(
+        return cls.model_construct(
             execution_id=item["execution_id"],
             policy_number=item["policy_number"],
             status=PolicyStatus(item["status"]),
-            started_at=(
-                datetime.fromisoformat(item["started_at"])
-                if item.get("started_at")
-                else None
-            ),
-            completed_at=(
-                datetime.fromisoformat(item["completed_at"])
-                if item.get("completed_at")
-                else None
+            started_at=_fromiso_or_none(item.get("started_at")),
+            completed_at=_fromiso_or_none(item.get("completed_at")),
+            duration_ms=(
+                int(item["duration_ms"]) if item.get("duration_ms") is not None else None
             ),
-            duration_ms=item.get("duration_ms"),
             error=item.get("error"),
             screenshots=item.get("screenshots", []),
             data=item.get("data", {}),
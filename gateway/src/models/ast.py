@@ -210,10 +210,10 @@ def create_ast_status_message(
     data: dict[str, Any] | None = None,
 ) -> ASTStatusMessage:
     """Create an AST status message."""
-    return ASTStatusMessage(
+    return ASTStatusMessage.model_construct(
         sessionId=session_id,
         payload=message or "",
-        meta=ASTStatusMeta(
+        meta=ASTStatusMeta.model_construct(
             astName=ast_name,
             status=status,
             message=message,
@@ -238,10 +238,10 @@ def create_ast_progress_message(
 ) -> ASTProgressMessage:
     """Create an AST progress message."""
     percent = round((current / total) * 100) if total > 0 else 0
-    return ASTProgressMessage(
+    return ASTProgressMessage.model_construct(
         sessionId=session_id,
         payload=message or f"Processing {current}/{total}",
-        meta=ASTProgressMeta(
+        meta=ASTProgressMeta.model_construct(
             executionId=execution_id,
             astName=ast_name,
             current=current,
@@ -264,10 +264,10 @@ def create_ast_item_result_message(
     data: dict[str, Any] | None = None,
 ) -> ASTItemResultMessage:
     """Create an AST item result message."""
-    return ASTItemResultMessage(
+    return ASTItemResultMessage.model_construct(
         sessionId=session_id,
         payload=item_id,
-        meta=ASTItemResultMeta(
+        meta=ASTItemResultMeta.model_construct(
             executionId=execution_id,
             itemId=item_id,
             status=status,
@@ -284,10 +284,10 @@ def create_ast_paused_message(
     message: str | None = None,
 ) -> ASTPausedMessage:
     """Create an AST paused status message."""
-    return ASTPausedMessage(
+    return ASTPausedMessage.model_construct(
         sessionId=session_id,
         payload=message or ("Paused" if paused else "Resumed"),
-        meta=ASTPausedMeta(
+        meta=ASTPausedMeta.model_construct(
             paused=paused,
             message=message,
         ),
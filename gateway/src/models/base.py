@@ -2,20 +2,23 @@
 # Base Message
 # ============================================================================
 
-from datetime import datetime
+import time
 
 from pydantic import BaseModel, Field
 
 
+def _now_ms() -> int:
+    """Current Unix time in milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
 class BaseMessage(BaseModel):
     """Base message with common fields."""
 
     session_id: str = Field(alias="sessionId")
-    timestamp: int = Field(
-        default_factory=lambda: int(datetime.now().timestamp() * 1000)
-    )
+    timestamp: int = Field(default_factory=_now_ms)
     encoding: str = "utf-8"
     seq: int = 0
     payload: str = ""
 
-    model_config = {"populate_by_name": True}
+    model_config = {"populate_by_name": True, "frozen": True}
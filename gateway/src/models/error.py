@@ -26,8 +26,8 @@ class ErrorMessage(BaseMessage):
 
 def create_error_message(session_id: str, code: str, message: str) -> ErrorMessage:
     """Create an error message."""
-    return ErrorMessage(
+    return ErrorMessage.model_construct(
         sessionId=session_id,
         payload=message,
-        meta=ErrorMeta(code=code),
+        meta=ErrorMeta.model_construct(code=code),
     )
@@ -4,24 +4,29 @@
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Annotated
 
-from src.models.ast import ASTItemResultMessage, ASTPausedMessage, ASTProgressMessage
+from pydantic import Field, TypeAdapter
 
-from .types import MessageType
+from .ast import (
+    ASTControlMessage,
+    ASTItemResultMessage,
+    ASTPausedMessage,
+    ASTProgressMessage,
+    ASTRunMessage,
+    ASTStatusMessage,
+)
+from .data import DataMessage
+from .error import ErrorMessage
+from .ping import PingMessage, PongMessage
+from .session import (
+    SessionCreatedMessage,
+    SessionCreateMessage,
+    SessionDestroyedMessage,
+    SessionDestroyMessage,
+)
 
 if TYPE_CHECKING:
-    from .ast import ASTRunMessage, ASTControlMessage, ASTStatusMessage
-    from .data import DataMessage
-    from .error import ErrorMessage
-    from .ping import PingMessage, PongMessage
-    from .session import (
-        SessionCreatedMessage,
-        SessionCreateMessage,
-        SessionDestroyedMessage,
-        SessionDestroyMessage,
-    )
     from .tn3270 import TN3270CursorMessage, TN3270ScreenMessage
 
     MessageEnvelope = (
@@ -44,51 +49,33 @@ if TYPE_CHECKING:
     )
 
 
-def parse_message(raw: str | bytes) -> "MessageEnvelope":
-    """Parse a raw JSON message into the appropriate message type."""
-    # Import here to avoid circular imports
-    from .ast import ASTRunMessage, ASTControlMessage, ASTStatusMessage
-    from .data import DataMessage
-    from .error import ErrorMessage
-    from .ping import PingMessage, PongMessage
-    from .session import (
-        SessionCreatedMessage,
-        SessionCreateMessage,
-        SessionDestroyedMessage,
-        SessionDestroyMessage,
-    )
+# Message types accepted from clients, discriminated by their wire "type" value
+_CLIENT_MESSAGE_ADAPTER: TypeAdapter = TypeAdapter(
+    Annotated[
+        DataMessage
+        | PingMessage
+        | PongMessage
+        | ErrorMessage
+        | SessionCreateMessage
+        | SessionDestroyMessage
+        | SessionCreatedMessage
+        | SessionDestroyedMessage
+        | ASTRunMessage
+        | ASTControlMessage
+        | ASTStatusMessage,
+        Field(discriminator="type"),
+    ]
+)
 
-    if isinstance(raw, bytes):
-        raw = raw.decode("utf-8")
 
-    data = json.loads(raw)
-    msg_type = data.get("type")
+def parse_message(raw: str | bytes) -> "MessageEnvelope":
+    """Parse a raw JSON message (str or UTF-8 bytes) into the appropriate message type.
 
-    match msg_type:
-        case MessageType.DATA:
-            return DataMessage.model_validate(data)
-        case MessageType.PING:
-            return PingMessage.model_validate(data)
-        case MessageType.PONG:
-            return PongMessage.model_validate(data)
-        case MessageType.ERROR:
-            return ErrorMessage.model_validate(data)
-        case MessageType.SESSION_CREATE:
-            return SessionCreateMessage.model_validate(data)
-        case MessageType.SESSION_DESTROY:
-            return SessionDestroyMessage.model_validate(data)
-        case MessageType.SESSION_CREATED:
-            return SessionCreatedMessage.model_validate(data)
-        case MessageType.SESSION_DESTROYED:
-            return SessionDestroyedMessage.model_validate(data)
-        case MessageType.AST_RUN:
-            return ASTRunMessage.model_validate(data)
-        case MessageType.AST_CONTROL:
-            return ASTControlMessage.model_validate(data)
-        case MessageType.AST_STATUS:
-            return ASTStatusMessage.model_validate(data)
-        case _:
-            raise ValueError(f"Unknown message type: {msg_type}")
+    JSON decoding and dispatch on ``type`` both happen in pydantic-core.
+    Raises ``pydantic.ValidationError`` (a ``ValueError``) for malformed JSON
+    or an unknown/missing type.
+    """
+    return _CLIENT_MESSAGE_ADAPTER.validate_json(raw)
 
 
 def serialize_message(msg: "MessageEnvelope") -> str:
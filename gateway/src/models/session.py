@@ -67,9 +67,9 @@ def create_session_created_message(
     session_id: str, shell: str, pid: int
 ) -> SessionCreatedMessage:
     """Create a session created message."""
-    return SessionCreatedMessage(
+    return SessionCreatedMessage.model_construct(
         sessionId=session_id,
-        meta=SessionCreatedMeta(shell=shell, pid=pid),
+        meta=SessionCreatedMeta.model_construct(shell=shell, pid=pid),
     )
 
 
@@ -98,8 +98,8 @@ def create_session_destroyed_message(
     session_id: str, reason: str
 ) -> SessionDestroyedMessage:
     """Create a session destroyed message."""
-    return SessionDestroyedMessage(
+    return SessionDestroyedMessage.model_construct(
         sessionId=session_id,
         payload=reason,
-        meta=SessionDestroyedMeta(),
+        meta=SessionDestroyedMeta.model_construct(),
     )
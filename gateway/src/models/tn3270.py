@@ -83,10 +83,10 @@ def create_tn3270_screen_message(
     cols: int,
 ) -> TN3270ScreenMessage:
     """Create a TN3270 screen message."""
-    return TN3270ScreenMessage(
+    return TN3270ScreenMessage.model_construct(
         sessionId=session_id,
         payload=ansi_data,
-        meta=TN3270ScreenMeta(
+        meta=TN3270ScreenMeta.model_construct(
             fields=fields,
             cursorRow=cursor_row,
             cursorCol=cursor_col,
@@ -102,8 +102,8 @@ def create_tn3270_cursor_message(
     col: int,
 ) -> TN3270CursorMessage:
     """Create a TN3270 cursor position message."""
-    return TN3270CursorMessage(
+    return TN3270CursorMessage.model_construct(
         sessionId=session_id,
         payload="",
-        meta=TN3270CursorMeta(row=row, col=col),
+        meta=TN3270CursorMeta.model_construct(row=row, col=col),
     )
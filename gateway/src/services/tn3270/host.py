@@ -26,6 +26,10 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger()
 
+# show_screen() masking/cleanup, compiled once
+_SECRET_VALUE_RE = re.compile(r"(Pass(?:word|code)\.+\s+)(\S+)", re.IGNORECASE)
+_BLANK_ROW_RE = re.compile(r"^\s*\d{2}\s*$\n", re.MULTILINE)
+
 # Field attribute bit masks
 FA_PROTECTED = 0x20
 FA_INTENSIFIED = 0x08
@@ -181,14 +185,9 @@ class Host:
             Formatted screen with row numbers and border.
         """
         screen_content = self.get_formatted_screen(show_row_numbers=True)
-        screen_content = re.sub(
-            r"(Password\.+\s+)(\S+)", r"\1******", screen_content, flags=re.IGNORECASE
-        )
-        screen_content = re.sub(
-            r"(Passcode\.+\s+)(\S+)", r"\1******", screen_content, flags=re.IGNORECASE
-        )
+        screen_content = _SECRET_VALUE_RE.sub(r"\1******", screen_content)
         # Remove empty new lines from screen content which only has row numbers
-        screen_content = re.sub(r"^\s*\d{2}\s*$\n", "", screen_content, flags=re.MULTILINE)
+        screen_content = _BLANK_ROW_RE.sub("", screen_content)
         seperator = "=" * 80
         if title:
             title_text = f" {title} "
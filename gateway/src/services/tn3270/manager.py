@@ -17,6 +17,8 @@ thread to avoid conflicts with the main asyncio event loop.
 import asyncio
 import concurrent.futures
 import threading
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Literal
@@ -127,7 +129,8 @@ class TN3270Session:
     tnz: "tnz_module.Tnz"
     renderer: TN3270Renderer
     created_at: datetime = field(default_factory=datetime.now)
-    last_activity: datetime = field(default_factory=datetime.now)
+    # Monotonic seconds (same clock as loop.time()), not wall-clock time
+    last_activity: float = field(default_factory=time.monotonic)
     connected: bool = False
     running_ast: AST | None = field(default=None, repr=False)
     _update_task: asyncio.Task | None = field(default=None, repr=False)
@@ -142,6 +145,14 @@ class TN3270Manager:
         self._valkey = valkey
         self._sessions: dict[str, TN3270Session] = {}
         self._renderer = TN3270Renderer()
+        # Per-session input handlers, keyed by the parsed message class
+        self._input_handlers: dict[
+            type, Callable[[TN3270Session, Any], Awaitable[None]]
+        ] = {
+            DataMessage: self._on_data_input,
+            ASTRunMessage: self._on_ast_run,
+            ASTControlMessage: self._on_ast_control,
+        }
 
     async def start(self) -> None:
         """Start the TN3270 manager."""
@@ -320,10 +331,19 @@ class TN3270Manager:
         await self._valkey.publish_tn3270_output(session_id, serialize_message(msg))
 
     async def destroy_all_sessions(self) -> None:
-        """Destroy all TN3270 sessions."""
-        session_ids = list(self._sessions.keys())
-        for session_id in session_ids:
-            await self.destroy_session(session_id, "shutdown")
+        """Destroy all TN3270 sessions concurrently."""
+        session_ids = tuple(self._sessions)
+        results = await asyncio.gather(
+            *(self.destroy_session(session_id, "shutdown") for session_id in session_ids),
+            return_exceptions=True,
+        )
+        for session_id, result in zip(session_ids, results, strict=True):
+            if isinstance(result, Exception):
+                log.error(
+                    "Failed to destroy TN3270 session",
+                    session_id=session_id,
+                    error=str(result),
+                )
 
     async def _update_loop(self, session: TN3270Session) -> None:
         """Poll for screen updates and send them to the client."""
@@ -345,7 +365,7 @@ class TN3270Manager:
                 # Check if screen updated
                 if tnz.updated:
                     tnz.updated = False
-                    session.last_activity = datetime.now()
+                    session.last_activity = loop.time()
 
                     # Send screen update with field data
                     await self._send_screen_update(session)
@@ -362,7 +382,7 @@ class TN3270Manager:
 
         try:
             msg = parse_message(raw_data)
-            if isinstance(msg, SessionDestroyMessage):
+            if type(msg) is SessionDestroyMessage:
                 # Handle session destroy even if session doesn't exist in our map
                 await self.destroy_session(session_id, "user_requested")
                 return
@@ -370,16 +390,22 @@ class TN3270Manager:
             if not session:
                 return
 
-            if isinstance(msg, DataMessage):
-                await self._process_input(session, msg.payload)
-            elif isinstance(msg, ASTRunMessage):
-                # Run AST as background task so we can still receive control messages
-                asyncio.create_task(self._run_ast(session, msg.meta.ast_name, msg.meta.params))
-            elif isinstance(msg, ASTControlMessage):
-                await self._handle_ast_control(session, msg.meta.action)
+            handler = self._input_handlers.get(type(msg))
+            if handler:
+                await handler(session, msg)
         except Exception:
             log.exception("Handle input error", session_id=session_id)
 
+    async def _on_data_input(self, session: TN3270Session, msg: DataMessage) -> None:
+        await self._process_input(session, msg.payload)
+
+    async def _on_ast_run(self, session: TN3270Session, msg: ASTRunMessage) -> None:
+        # Run AST as background task so we can still receive control messages
+        asyncio.create_task(self._run_ast(session, msg.meta.ast_name, msg.meta.params))
+
+    async def _on_ast_control(self, session: TN3270Session, msg: ASTControlMessage) -> None:
+        await self._handle_ast_control(session, msg.meta.action)
+
     async def _handle_ast_control(self, session: TN3270Session, action: str) -> None:
         """Handle AST control commands (pause/resume/cancel)."""
         ast = session.running_ast
@@ -524,15 +550,18 @@ class TN3270Manager:
                 if paused:
                     await self._send_screen_update(session)
 
-                # Update execution status in DynamoDB
+                # Update execution status in DynamoDB (blocking call, keep it off the loop)
                 from ...db import get_dynamodb_client
 
                 db = get_dynamodb_client()
                 new_status = "paused" if paused else "running"
-                db.update_execution(
-                    session_id=session.session_id,
-                    execution_id=execution_id,
-                    updates={"status": new_status},
+                await loop.run_in_executor(
+                    _executor,
+                    lambda: db.update_execution(
+                        session_id=session.session_id,
+                        execution_id=execution_id,
+                        updates={"status": new_status},
+                    ),
                 )
                 log.info(
                     "Updated execution status",
@@ -693,6 +722,7 @@ class TN3270Manager:
 
     async def _handle_gateway_control(self, raw_data: str) -> None:
         """Handle global gateway control messages (session creation)."""
+        msg = None
         try:
             msg = parse_message(raw_data)
 
@@ -719,15 +749,15 @@ class TN3270Manager:
                 )
 
         except TerminalError as e:
-            try:
-                parsed = parse_message(raw_data)
-                if hasattr(parsed, "session_id"):
-                    error_msg = create_error_message(parsed.session_id, e.code, e.message)
+            # Reuse the parsed message to address the error to its session
+            if msg is not None:
+                try:
+                    error_msg = create_error_message(msg.session_id, e.code, e.message)
                     await self._valkey.publish_tn3270_output(
-                        parsed.session_id, serialize_message(error_msg)
+                        msg.session_id, serialize_message(error_msg)
                     )
-            except Exception:
-                pass
+                except Exception:
+                    pass
             log.warning("TN3270 gateway control error", error=str(e))
         except Exception:
             log.exception("Handle TN3270 gateway control error")
@@ -390,20 +390,19 @@ class TN3270Renderer:
 
     def is_position_protected(self, tnz: "Tnz", row: int, col: int) -> bool:
         """Check if a screen position is in a protected field."""
-        screen_data = self.render_screen_with_fields(tnz)
-        addr = row * screen_data.cols + col
-
-        for field in screen_data.fields:
-            # Check if address is within this field
-            if field.end > field.start:
-                # Normal case - no wrap
-                if field.start <= addr < field.end:
-                    return field.protected
-            else:
-                # Wrap-around case
-                if addr >= field.start or addr < field.end:
-                    return field.protected
-
-        # If no field contains this position, consider it protected
-        # (positions before the first field attribute are protected)
+        plane_fa = tnz.plane_fa
+        size = tnz.maxrow * tnz.maxcol
+        addr = row * tnz.maxcol + col
+        if not 0 <= addr < size or plane_fa[addr]:
+            # Off-screen and field attribute positions never accept input
+            return True
+
+        # The covering field starts at the nearest attribute before addr,
+        # wrapping past the top of the screen (negative indexes wrap for us)
+        for offset in range(1, size):
+            fa = plane_fa[addr - offset]
+            if fa:
+                return bool(fa & 0x20)
+
+        # No field attributes at all - unformatted screens are treated as protected
         return True
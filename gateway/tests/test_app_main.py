@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import gc
 from types import SimpleNamespace
 import unittest
 from unittest.mock import AsyncMock, patch
@@ -12,19 +11,15 @@ import src.app as app_module
 
 
 class AppAsyncTests(unittest.IsolatedAsyncioTestCase):
-    def tearDown(self) -> None:
-        """Clean up any remaining coroutines after each test."""
-        # Force garbage collection to clean up test artifacts
-        gc.collect()
-        super().tearDown()
-
     async def test_async_main_initializes_components(self) -> None:
         config = SimpleNamespace(
             valkey=SimpleNamespace(host="valkey", port=6379),
             tn3270=SimpleNamespace(host="host", port=23, max_sessions=2),
             dynamodb=SimpleNamespace(),
         )
-        fake_valkey = SimpleNamespace(start_listening=AsyncMock())
+        # Set once async_main has finished wiring up and is about to wait
+        ready = asyncio.Event()
+        fake_valkey = SimpleNamespace(start_listening=AsyncMock(side_effect=ready.set))
         fake_manager = SimpleNamespace(start=AsyncMock())
         fake_loop = SimpleNamespace(add_signal_handler=lambda *args, **kwargs: None)
 
@@ -38,7 +33,14 @@ class AppAsyncTests(unittest.IsolatedAsyncioTestCase):
             "asyncio.get_running_loop", return_value=fake_loop
         ):
             task = asyncio.create_task(app_module.async_main())
-            await asyncio.sleep(0)
+            ready_task = asyncio.create_task(ready.wait())
+            done, _ = await asyncio.wait(
+                {ready_task, task}, timeout=1.0, return_when=asyncio.FIRST_COMPLETED
+            )
+            if task in done:
+                # async_main ended before listening; re-raise its error, if any
+                task.result()
+            self.assertIn(ready_task, done, "async_main never started listening")
             assert app_module._shutdown_event is not None
             app_module._shutdown_event.set()
             await task
@@ -75,39 +77,20 @@ class AppAsyncTests(unittest.IsolatedAsyncioTestCase):
         mock_run.assert_called_once()
 
     def test_main_handles_keyboard_interrupt(self) -> None:
-        shutdown_called = False
-        main_called = False
-
-        async def fake_async_main():
-            nonlocal main_called
-            main_called = True
-            # Simulate the function running but being interrupted
-
-        async def fake_shutdown():
-            nonlocal shutdown_called
-            shutdown_called = True
-
-        original_run = asyncio.run
+        run_names: list[str] = []
 
         def fake_run(coro):
-            if not hasattr(fake_run, "times"):
-                fake_run.times = 0  # type: ignore[attr-defined]
-            fake_run.times += 1  # type: ignore[attr-defined]
-            if fake_run.times == 1:
-                # First call: run the coroutine then raise KeyboardInterrupt
-                result = original_run(coro)
+            # Record which entry point was scheduled without spinning up a loop
+            run_names.append(coro.cr_code.co_name)
+            coro.close()
+            if len(run_names) == 1:
                 raise KeyboardInterrupt
-            # Second call: run shutdown normally
-            return original_run(coro)
 
-        with patch.object(app_module, "async_main", new=fake_async_main), patch.object(
-            app_module, "shutdown", new=fake_shutdown
-        ), patch("asyncio.run", side_effect=fake_run) as mock_run:
+        with patch("asyncio.run", side_effect=fake_run) as mock_run:
             app_module.main()
 
         self.assertEqual(mock_run.call_count, 2)
-        self.assertTrue(main_called)
-        self.assertTrue(shutdown_called)
+        self.assertEqual(run_names, ["async_main", "shutdown"])
 
 
 if __name__ == "__main__":  # pragma: no cover
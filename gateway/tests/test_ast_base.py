@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import threading
 import time
+from typing import Any
 import unittest
+from unittest.mock import MagicMock, patch
 
 from datetime import datetime, timedelta
 
@@ -71,9 +72,17 @@ class ASTBaseTests(unittest.TestCase):
     def test_cancel_and_wait_if_paused(self) -> None:
         self.ast.pause()
 
-        resume_timer = threading.Timer(0.05, self.ast.resume)
-        resume_timer.start()
-        self.assertTrue(self.ast.wait_if_paused(timeout=1))
+        # Resume as soon as the AST starts blocking rather than after a fixed delay
+        pause_event = self.ast._pause_event
+        original_wait = pause_event.wait
+
+        def resume_then_wait(timeout: float | None = None) -> bool:
+            self.ast.resume()
+            return original_wait(timeout)
+
+        with patch.object(pause_event, "wait", side_effect=resume_then_wait) as mock_wait:
+            self.assertTrue(self.ast.wait_if_paused(timeout=1))
+        mock_wait.assert_called_once_with(timeout=1)
 
         self.ast.cancel()
         self.assertTrue(self.ast.is_cancelled)
@@ -87,15 +96,16 @@ class ASTBaseTests(unittest.TestCase):
         self.assertTrue(self.progress_calls)
         self.assertTrue(self.item_calls)
 
-    def test_run_handles_timeout(self) -> None:
-        result = self.ast.run(self.host, raise_timeout=True)
-        self.assertEqual(result.status, ASTStatus.TIMEOUT)
-        self.assertIn("Timeout", result.message)
-
-    def test_run_handles_generic_error(self) -> None:
-        result = self.ast.run(self.host, raise_error=True)
-        self.assertEqual(result.status, ASTStatus.FAILED)
-        self.assertIn("Error:", result.message)
+    def test_run_handles_execute_errors(self) -> None:
+        cases: list[tuple[str, dict[str, Any], ASTStatus, str]] = [
+            ("timeout", {"raise_timeout": True}, ASTStatus.TIMEOUT, "Timeout"),
+            ("error", {"raise_error": True}, ASTStatus.FAILED, "Error:"),
+        ]
+        for name, kwargs, status, substring in cases:
+            with self.subTest(name):
+                result = SampleAST().run(self.host, **kwargs)
+                self.assertEqual(result.status, status)
+                self.assertIn(substring, result.message)
 
     def test_ast_result_helpers_and_item_result(self) -> None:
         start = datetime.now()
@@ -120,6 +130,54 @@ class ASTBaseTests(unittest.TestCase):
         self.assertTrue(result.is_success)
         self.assertEqual(result.item_results[0].data["k"], "v")
 
+    def _save_results(self, count: int) -> None:
+        now = datetime.now()
+        for index in range(count):
+            self.ast._save_item_result(f"item-{index}", "success", 1, now, now)
+
+    def test_item_results_are_written_in_batches_during_run(self) -> None:
+        self.ast._db = MagicMock()
+        self.ast._execution_id = "exec-1"
+
+        self._save_results(26)
+
+        # A full batch is written as soon as it is queued, not at the end of the run
+        self.ast._db.put_policy_results.assert_called_once()
+        written = self.ast._db.put_policy_results.call_args.kwargs["results"]
+        self.assertEqual(len(written), 25)
+
+        self.ast._update_execution_record("success", "done", [])
+
+        self.assertEqual(self.ast._db.put_policy_results.call_count, 2)
+        remainder = self.ast._db.put_policy_results.call_args.kwargs["results"]
+        self.assertEqual([item_id for item_id, _ in remainder], ["item-25"])
+
+    def test_pausing_writes_pending_item_results(self) -> None:
+        self.ast._db = MagicMock()
+        self.ast._execution_id = "exec-1"
+        self._save_results(3)
+        self.ast._db.put_policy_results.assert_not_called()
+
+        self.ast.pause()
+        self.assertTrue(self.ast.wait_if_paused(timeout=0))
+
+        self.ast._db.put_policy_results.assert_called_once()
+        written = self.ast._db.put_policy_results.call_args.kwargs["results"]
+        self.assertEqual(len(written), 3)
+
+    def test_failed_batch_falls_back_to_single_writes(self) -> None:
+        self.ast._db = MagicMock()
+        self.ast._db.put_policy_results.side_effect = ValueError("bad item")
+        self.ast._execution_id = "exec-1"
+
+        self._save_results(2)
+        self.ast._flush_item_results()
+
+        self.assertEqual(
+            [c.kwargs["policy_number"] for c in self.ast._db.put_policy_result.call_args_list],
+            ["item-0", "item-1"],
+        )
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -14,16 +14,26 @@ class CliTests(unittest.TestCase):
     def test_run_tests_invokes_pytest(self) -> None:
         with patch("src.cli.pytest.main", return_value=0) as pytest_main, patch(
             "src.cli.sys.exit"
-        ) as sys_exit:
+        ) as sys_exit, patch("src.cli.find_spec", return_value=None):
             cli.run_tests()
 
         pytest_main.assert_called_once_with([str(cli.TESTS_DIR), "-v"])
         sys_exit.assert_called_once_with(0)
 
+    def test_run_tests_parallelizes_when_xdist_is_installed(self) -> None:
+        with patch("src.cli.pytest.main", return_value=0) as pytest_main, patch(
+            "src.cli.sys.exit"
+        ), patch("src.cli.find_spec", return_value=MagicMock()):
+            cli.run_tests()
+
+        pytest_main.assert_called_once_with(
+            [str(cli.TESTS_DIR), "-v", "-n", "auto", "--dist=loadfile"]
+        )
+
     def test_run_coverage_invokes_pytest_with_cov_options(self) -> None:
         with patch("src.cli.pytest.main", return_value=0) as pytest_main, patch(
             "src.cli.sys.exit"
-        ) as sys_exit:
+        ) as sys_exit, patch("src.cli.find_spec", return_value=None):
             cli.run_coverage()
 
         pytest_main.assert_called_once_with([
@@ -87,6 +87,33 @@ class ConfigTests(unittest.TestCase):
         self.assertIs(first, second)
         self.assertEqual(second.valkey.host, "cache-host")
 
+    def test_from_env_reads_given_mapping(self) -> None:
+        with patch.dict(os.environ, {"VALKEY_HOST": "ignored-host"}, clear=False):
+            cfg = config_module.Config.from_env(
+                {"VALKEY_HOST": "snapshot-host", "TN3270_PORT": "992"}
+            )
+
+        self.assertEqual(cfg.valkey.host, "snapshot-host")
+        self.assertEqual(cfg.valkey.port, 6379)
+        self.assertEqual(cfg.tn3270.port, 992)
+        self.assertFalse(cfg.tn3270.secure)
+        self.assertEqual(cfg.dynamodb.table_name, "terminal")
+
+    def test_section_constructors_read_environment(self) -> None:
+        with patch.dict(
+            os.environ,
+            {"VALKEY_PORT": "6390", "TN3270_SECURE": "true", "DYNAMODB_TABLE": "env-table"},
+            clear=False,
+        ):
+            valkey = config_module.ValkeyConfig()
+            tn3270 = config_module.TN3270Config(host="explicit-host")
+            dynamodb = config_module.DynamoDBConfig()
+
+        self.assertEqual(valkey.port, 6390)
+        self.assertTrue(tn3270.secure)
+        self.assertEqual(tn3270.host, "explicit-host")
+        self.assertEqual(dynamodb.table_name, "env-table")
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -3,31 +3,55 @@
 from __future__ import annotations
 
 import unittest
-from unittest.mock import MagicMock, patch
+from collections.abc import Iterator
+from unittest.mock import MagicMock, Mock, patch
 
 from src.core.config import DynamoDBConfig
 from src.db import client as client_module
 from src.db.client import DynamoDBClient, get_dynamodb_client
+from src.db.models import PolicyResult
+
+# Frozen dataclass, safe to share across tests
+_CONFIG = DynamoDBConfig(
+    endpoint="http://localhost:8042",
+    region="us-east-1",
+    table_name="terminal",
+    access_key_id="dummy",
+    secret_access_key="dummy",
+)
+
+# Table resource methods the client calls; anything else is a typo in the test
+_TABLE_METHODS = [
+    "batch_writer",
+    "delete_item",
+    "get_item",
+    "put_item",
+    "query",
+    "scan",
+    "update_item",
+]
 
 
 class DynamoDBClientTests(unittest.TestCase):
     """Validate DynamoDB wrapper behavior without touching AWS."""
 
-    def setUp(self) -> None:
-        self.config = DynamoDBConfig(
-            endpoint="http://localhost:8042",
-            region="us-east-1",
-            table_name="terminal",
-            access_key_id="dummy",
-            secret_access_key="dummy",
-        )
+    config = _CONFIG
+
+    @classmethod
+    def setUpClass(cls) -> None:
         resource_patcher = patch("src.db.client.boto3.resource")
         client_patcher = patch("src.db.client.boto3.client")
-        self.addCleanup(resource_patcher.stop)
-        self.addCleanup(client_patcher.stop)
-        self.mock_resource = resource_patcher.start()
-        self.mock_client_ctor = client_patcher.start()
-        self.mock_table = MagicMock()
+        cls.addClassCleanup(resource_patcher.stop)
+        cls.addClassCleanup(client_patcher.stop)
+        cls.mock_resource = resource_patcher.start()
+        cls.mock_client_ctor = client_patcher.start()
+
+    def setUp(self) -> None:
+        self.mock_resource.reset_mock(return_value=True, side_effect=True)
+        self.mock_client_ctor.reset_mock(return_value=True, side_effect=True)
+        self.mock_table = Mock(spec=_TABLE_METHODS)
+        # batch_writer is used as a context manager, which plain Mock does not support
+        self.mock_table.batch_writer = MagicMock()
         self.mock_resource.return_value.Table.return_value = self.mock_table
         self.mock_low_level = self.mock_client_ctor.return_value
         self.mock_low_level.describe_table.return_value = {"Table": {}}
@@ -63,12 +87,36 @@ class DynamoDBClientTests(unittest.TestCase):
 
     def test_query_helpers_delegate_to_table(self) -> None:
         client = DynamoDBClient(self.config)
+        paginator = self.mock_resource.return_value.meta.client.get_paginator.return_value
+        paginator.paginate.return_value = [{"Items": [{"id": 1}]}, {"Items": [{"id": 2}]}]
         self.mock_table.query.return_value = {"Items": [{"id": 1}]}
-        client.query_pk("PK")
+        self.assertEqual(client.query_pk("PK"), [{"id": 1}, {"id": 2}])
         client.query_pk("PK", sk_prefix="SESSION", limit=5)
         client.query_gsi1("email@example.com", sk_prefix="PROFILE")
         client.query_gsi2("GSI2PK", scan_forward=True, limit=2, exclusive_start_key={"PK": "1"})
-        self.assertGreaterEqual(self.mock_table.query.call_count, 4)
+        self.assertEqual(paginator.paginate.call_count, 3)
+        self.assertEqual(
+            paginator.paginate.call_args_list[1].kwargs["PaginationConfig"],
+            {"MaxItems": 5, "PageSize": 5},
+        )
+        self.assertEqual(paginator.paginate.call_args.kwargs["IndexName"], "GSI1")
+        self.mock_table.query.assert_called_once()
+
+    def test_iter_query_pk_stops_early(self) -> None:
+        client = DynamoDBClient(self.config)
+        paginator = self.mock_resource.return_value.meta.client.get_paginator.return_value
+        pages_read: list[int] = []
+
+        def pages(**_: object) -> Iterator[dict[str, list[dict[str, int]]]]:
+            for page in range(3):
+                pages_read.append(page)
+                yield {"Items": [{"page": page}]}
+
+        paginator.paginate.side_effect = pages
+        first = next(client.iter_query_pk("PK"))
+
+        self.assertEqual(first, {"page": 0})
+        self.assertEqual(pages_read, [0])
 
     def test_domain_specific_helpers(self) -> None:
         client = DynamoDBClient(self.config)
@@ -87,6 +135,55 @@ class DynamoDBClientTests(unittest.TestCase):
         client.get_user_executions_by_date("u1", "2024-01-01", status="running")
         self.assertTrue(self.mock_table.put_item.called)
 
+    def test_put_policy_results_uses_batch_writer(self) -> None:
+        client = DynamoDBClient(self.config)
+        batch = self.mock_table.batch_writer.return_value.__enter__.return_value
+
+        client.put_policy_results(
+            "exec1", [("policy1", {"status": "success"}), ("policy2", {"status": "failed"})]
+        )
+
+        self.mock_table.batch_writer.assert_called_once_with(overwrite_by_pkeys=["PK", "SK"])
+        self.assertEqual(batch.put_item.call_count, 2)
+        item = batch.put_item.call_args.kwargs["Item"]
+        self.assertEqual(item["PK"], "EXECUTION#exec1")
+        self.assertEqual(item["SK"], "POLICY#policy2")
+        self.assertEqual(item["status"], "failed")
+        self.mock_table.put_item.assert_not_called()
+
+    def test_put_items_writes_model_items_in_one_batch(self) -> None:
+        client = DynamoDBClient(self.config)
+        batch = self.mock_table.batch_writer.return_value.__enter__.return_value
+        results = [PolicyResult(execution_id="exec1", policy_number=f"P{i}") for i in range(3)]
+
+        client.put_items(result.to_dynamodb() for result in results)
+
+        self.mock_table.batch_writer.assert_called_once()
+        self.assertEqual(
+            [call.kwargs["Item"]["SK"] for call in batch.put_item.call_args_list],
+            ["POLICY#P0", "POLICY#P1", "POLICY#P2"],
+        )
+
+    def test_get_user_full_history_nests_executions_and_policies(self) -> None:
+        client = DynamoDBClient(self.config)
+        with patch.object(
+            client, "get_user_sessions", return_value=[{"session_id": "s1"}, {"session_id": "s2"}]
+        ), patch.object(
+            client,
+            "get_session_executions",
+            side_effect=lambda sid: [{"execution_id": f"{sid}-e1"}],
+        ), patch.object(
+            client,
+            "get_execution_policies",
+            side_effect=lambda eid: [{"policy_number": f"{eid}-p1"}],
+        ):
+            history = client.get_user_full_history("u1")
+
+        self.assertEqual([s["session_id"] for s in history], ["s1", "s2"])
+        execution = history[1]["executions"][0]
+        self.assertEqual(execution["execution_id"], "s2-e1")
+        self.assertEqual(execution["policies"], [{"policy_number": "s2-e1-p1"}])
+
     def test_get_execution_by_id_scans_table(self) -> None:
         client = DynamoDBClient(self.config)
         self.mock_table.scan.return_value = {"Items": [{"SK": "EXECUTION#id"}]}
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from decimal import Decimal
 import importlib
 import sys
 import unittest
@@ -105,6 +106,41 @@ class DbModelTests(unittest.TestCase):
             self.assertEqual(restored.status, db_models.PolicyStatus.SUCCESS)
             self.assertEqual(restored.data["k"], "v")
 
+    def test_from_dynamodb_converts_decimal_numbers(self) -> None:
+        with _fresh_module("src.db.models") as db_models:
+            execution = db_models.ASTExecution(
+                execution_id="e1", session_id="s1", ast_name="login"
+            ).to_dynamodb()
+            policy = db_models.PolicyResult(
+                execution_id="e1", policy_number="123456789"
+            ).to_dynamodb()
+
+            restored_execution = db_models.ASTExecution.from_dynamodb(
+                {**execution, "progress": Decimal("40")}
+            )
+            restored_policy = db_models.PolicyResult.from_dynamodb(
+                {**policy, "duration_ms": Decimal("250")}
+            )
+
+            self.assertEqual(restored_execution.progress, 40)
+            self.assertIs(type(restored_execution.progress), int)
+            self.assertEqual(restored_policy.duration_ms, 250)
+            self.assertIs(type(restored_policy.duration_ms), int)
+            self.assertEqual(restored_policy.screenshots, [])
+
+    def test_to_dynamodb_reflects_updated_timestamps(self) -> None:
+        with _fresh_module("src.db.models") as db_models:
+            policy = db_models.PolicyResult(execution_id="e1", policy_number="123456789")
+            self.assertIsNone(policy.to_dynamodb()["completed_at"])
+
+            finished = datetime(2024, 1, 2, 3, 4, 5)
+            policy.completed_at = finished
+            self.assertEqual(policy.to_dynamodb()["completed_at"], finished.isoformat())
+
+            restarted = datetime(2024, 2, 3, 4, 5, 6)
+            copied = policy.model_copy(update={"started_at": restarted})
+            self.assertEqual(copied.to_dynamodb()["started_at"], restarted.isoformat())
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
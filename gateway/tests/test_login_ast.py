@@ -58,8 +58,8 @@ class _FakeDB:
     def put_execution(self, **kwargs) -> None:
         self.executions.append((kwargs.get("data", {}), kwargs))
 
-    def put_policy_result(self, execution_id: str, policy_number: str, data: dict) -> None:
-        self.policy_results.append((policy_number, data))
+    def put_policy_results(self, execution_id: str, results: list[tuple[str, dict]]) -> None:
+        self.policy_results.extend(results)
 
     def update_execution(self, session_id: str, execution_id: str, updates: dict) -> None:
         self.updates.append(updates)
@@ -6,6 +6,7 @@ import importlib
 import unittest
 
 import src.models.ast as ast_module
+import src.models.parser as parser_module
 
 
 class ASTFactoryTests(unittest.TestCase):
@@ -14,6 +15,8 @@ class ASTFactoryTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
         importlib.reload(ast_module)
+        # The parser's TypeAdapter binds the AST classes at import time
+        importlib.reload(parser_module)
 
     def test_create_ast_status_message_sets_meta(self) -> None:
         msg = ast_module.create_ast_status_message(
@@ -47,6 +47,13 @@ class BaseMessageTests(unittest.TestCase):
         self.assertEqual(msg.seq, 42)
         self.assertEqual(msg.payload, "custom")
 
+    def test_messages_are_immutable(self) -> None:
+        msg = base_module.BaseMessage(sessionId="sess-4")
+
+        # pydantic's ValidationError subclasses ValueError
+        with self.assertRaisesRegex(ValueError, "frozen"):
+            msg.payload = "changed"
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -40,6 +40,10 @@ class SessionMessageTests(unittest.TestCase):
         self.assertIsInstance(msg.meta, SessionDestroyedMeta)
         self.assertEqual(msg.payload, "done")
 
+    def test_session_destroyed_meta_accepts_field_name_and_alias(self) -> None:
+        self.assertEqual(SessionDestroyedMeta.model_validate({"exit_code": 3}).exit_code, 3)
+        self.assertEqual(SessionDestroyedMeta.model_validate({"exitCode": 4}).exit_code, 4)
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
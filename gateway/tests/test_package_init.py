@@ -2,41 +2,22 @@
 
 from __future__ import annotations
 
-import importlib
-import sys
 import unittest
 
-
-class _fresh_module:
-    def __init__(self, name: str) -> None:
-        self.name = name
-        self.original = sys.modules.get(name)
-
-    def __enter__(self):
-        if self.original is not None:
-            sys.modules.pop(self.name, None)
-        return importlib.import_module(self.name)
-
-    def __exit__(self, exc_type, exc, tb):
-        sys.modules.pop(self.name, None)
-        if self.original is not None:
-            sys.modules[self.name] = self.original
-        return False
+import src
 
 
 class PackageInitTests(unittest.TestCase):
     def test_gateway_package_exports(self) -> None:
-        with _fresh_module("src") as module:
-            for name in [
-                "main",
-                "Config",
-                "TN3270Manager",
-                "ValkeyClient",
-                "create_data_message",
-            ]:
-                self.assertTrue(hasattr(module, name))
+        for name in [
+            "main",
+            "Config",
+            "TN3270Manager",
+            "ValkeyClient",
+            "create_data_message",
+        ]:
+            self.assertTrue(hasattr(src, name))
 
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
-
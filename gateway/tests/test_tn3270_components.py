@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import unittest
 
 from src.services.tn3270.host import Host
@@ -36,6 +38,8 @@ class _FakeTnz:
             for addr, value in attrs.items():
                 self.plane_fa[addr % self._size] = value
                 self.plane_dc[addr % self._size] = 0
+        # plane_dc is never mutated after construction, so render it once
+        self._screen = bytes(val or 0x20 for val in self.plane_dc).decode("latin-1")
         self.plane_fg = [0] * self._size
         self.plane_bg = [0] * self._size
         self.plane_eh = [0] * self._size
@@ -50,13 +54,7 @@ class _FakeTnz:
     # Basic tnz operations used by Host/TN3270Renderer
     # ------------------------------------------------------------------
     def scrstr(self, start: int, end: int) -> str:
-        start = max(0, start)
-        end = min(self._size, end)
-        chars = []
-        for idx in range(start, end):
-            val = self.plane_dc[idx]
-            chars.append(chr(val) if val else " ")
-        return "".join(chars)
+        return self._screen[max(0, start) : min(self._size, end)]
 
     def set_cursor_position(self, row: int, col: int) -> None:
         # tnz uses 1-indexed coordinates
@@ -72,7 +70,8 @@ class _FakeTnz:
         self.commands.append(("eraseinput", value))
 
 
-def _build_test_session() -> _FakeTnz:
+@functools.lru_cache(maxsize=1)
+def _session_template() -> _FakeTnz:
     # Field attribute bytes: protected label at 0, unprotected input at 4
     attrs = {
         0: 0x28,  # Protected + intensified
@@ -83,6 +82,11 @@ def _build_test_session() -> _FakeTnz:
     return session
 
 
+def _build_test_session() -> _FakeTnz:
+    # Tests move the cursor and record commands, so hand out independent copies
+    return copy.deepcopy(_session_template())
+
+
 class TN3270RendererTests(unittest.TestCase):
     """Validate screen rendering helpers."""
 
@@ -110,6 +114,20 @@ class TN3270RendererTests(unittest.TestCase):
         self.assertTrue(self.renderer.is_position_protected(self.session, 0, 1))
         self.assertFalse(self.renderer.is_position_protected(self.session, 0, 6))
 
+    def test_is_position_protected_matches_rendered_fields(self) -> None:
+        fields = self.renderer.render_screen_with_fields(self.session).fields
+        protected_at = {}
+        for field in fields:
+            for offset in range(field.length):
+                protected_at[(field.start + offset) % self.session._size] = field.protected
+
+        for addr in range(self.session._size):
+            with self.subTest(addr=addr):
+                self.assertEqual(
+                    self.renderer.is_position_protected(self.session, 0, addr),
+                    protected_at.get(addr, True),
+                )
+
     def test_cursor_and_size_helpers(self) -> None:
         cursor_row, cursor_col = self.renderer.get_cursor_position(self.session)
         rows, cols = self.renderer.get_screen_size(self.session)
@@ -4,11 +4,19 @@ from __future__ import annotations
 
 import asyncio
 import threading
+from collections.abc import Callable
 from types import SimpleNamespace
+from typing import Any
 import unittest
-from unittest.mock import AsyncMock, MagicMock, patch
-
-from src.ast.base import ASTResult, ASTStatus
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+from src.ast.base import (
+    ASTResult,
+    ASTStatus,
+    ItemResultCallback,
+    PauseStateCallback,
+    ProgressCallback,
+)
 from src.core import TN3270Config, TerminalError
 from src.models import (
     ASTControlMessage,
@@ -87,6 +95,58 @@ class ManagerExtendedTests(unittest.IsolatedAsyncioTestCase):
             await self.manager._process_input(session, "ABC")
             self.assertIn("data:ABC", tnz.calls)
 
+    async def test_update_loop_stamps_activity_with_loop_time(self) -> None:
+        tnz = SimpleNamespace(seslost=False, updated=True, wait=lambda timeout: None)
+        session = TN3270Session(
+            session_id="sess",
+            host="h",
+            port=23,
+            tnz=tnz,
+            renderer=self.manager._renderer,
+            connected=True,
+        )
+        session.last_activity = 0.0
+
+        async def send_once(_session: TN3270Session) -> None:
+            session._stop_event.set()
+
+        before = asyncio.get_running_loop().time()
+        with patch.object(self.manager, "_send_screen_update", new=send_once):
+            await self.manager._update_loop(session)
+
+        self.assertFalse(tnz.updated)
+        self.assertGreaterEqual(session.last_activity, before)
+
+    async def test_destroy_all_sessions_runs_concurrently(self) -> None:
+        self.manager._sessions = {"s1": MagicMock(), "s2": MagicMock()}
+        started: list[str] = []
+        all_started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fake_destroy(session_id: str, reason: str) -> None:
+            started.append(session_id)
+            if len(started) == 2:
+                all_started.set()
+            await release.wait()
+            if session_id == "s1":
+                raise RuntimeError("close failed")
+
+        with patch.object(self.manager, "destroy_session", new=fake_destroy), patch(
+            "src.services.tn3270.manager.log"
+        ) as mock_log:
+            task = asyncio.create_task(self.manager.destroy_all_sessions())
+            try:
+                # Sequential destroys would block on the first session and time out here
+                await asyncio.wait_for(all_started.wait(), timeout=1)
+            finally:
+                release.set()
+                await task
+
+        self.assertCountEqual(started, ["s1", "s2"])
+        mock_log.error.assert_called_once_with(
+            "Failed to destroy TN3270 session", session_id="s1", error="close failed"
+        )
+
     async def test_handle_gateway_control_success_and_error(self) -> None:
         payload = SessionCreateMessage(sessionId="abc", meta={"shell": "host:50"})
         with patch(
@@ -96,15 +156,16 @@ class ManagerExtendedTests(unittest.IsolatedAsyncioTestCase):
         mock_create.assert_awaited_once_with("abc", host="host", port=50)
 
         error = TerminalError("E1", "fail")
-        second_payload = SimpleNamespace(session_id="abc")
         with patch(
-            "src.services.tn3270.manager.parse_message",
-            side_effect=[error, second_payload],
+            "src.services.tn3270.manager.parse_message", return_value=payload
+        ) as mock_parse, patch.object(
+            self.manager, "create_session", new=AsyncMock(side_effect=error)
         ), patch.object(
             self.valkey, "publish_tn3270_output", new=AsyncMock()
         ) as mock_publish:
             await self.manager._handle_gateway_control("broken")
-        mock_publish.assert_awaited()
+        mock_parse.assert_called_once_with("broken")
+        mock_publish.assert_awaited_once_with("abc", ANY)
 
     async def test_handle_input_routes_messages(self) -> None:
         session = TN3270Session(
@@ -311,6 +372,70 @@ class ManagerExtendedTests(unittest.IsolatedAsyncioTestCase):
         self.assertGreaterEqual(self.valkey.publish_tn3270_output.await_count, 2)
         self.assertIsNone(session.running_ast)
 
+    async def test_run_ast_pause_updates_execution_off_loop(self) -> None:
+        class PausingAST:
+            name = "login"
+
+            def __init__(self) -> None:
+                self.on_pause_state: PauseStateCallback | None = None
+
+            def set_callbacks(
+                self,
+                on_progress: ProgressCallback | None = None,
+                on_item_result: ItemResultCallback | None = None,
+                on_pause_state: PauseStateCallback | None = None,
+            ) -> None:
+                self.on_pause_state = on_pause_state
+
+            def run(self, host: object, execution_id: str, **kwargs: object) -> ASTResult:
+                assert self.on_pause_state is not None
+                self.on_pause_state(True, "paused")
+                return ASTResult(status=ASTStatus.SUCCESS, message="ok")
+
+        executed: list[object] = []
+
+        class FakeLoop:
+            async def run_in_executor(
+                self,
+                executor: object,
+                func: Callable[..., Any],
+                *args: object,
+                **kwargs: object,
+            ) -> Any:
+                executed.append(func)
+                return func(*args, **kwargs)
+
+        pause_tasks: list[asyncio.Task] = []
+        session = TN3270Session(
+            session_id="sess",
+            host="h",
+            port=23,
+            tnz=_StubTnz(),
+            renderer=self.manager._renderer,
+            connected=True,
+        )
+        fake_db = MagicMock()
+
+        with patch("src.services.tn3270.manager.Host", return_value=MagicMock()), patch(
+            "src.services.tn3270.manager.LoginAST", return_value=PausingAST()
+        ), patch("src.services.tn3270.manager.uuid4", return_value="exec-1"), patch(
+            "src.services.tn3270.manager.asyncio.get_running_loop",
+            return_value=FakeLoop(),
+        ), patch(
+            "src.services.tn3270.manager.asyncio.run_coroutine_threadsafe",
+            side_effect=lambda coro, loop: pause_tasks.append(asyncio.create_task(coro)),
+        ), patch("src.db.get_dynamodb_client", return_value=fake_db), patch.object(
+            self.manager, "_send_screen_update", new=AsyncMock()
+        ):
+            await self.manager._run_ast(session, "login", {})
+            await asyncio.gather(*pause_tasks)
+
+        fake_db.update_execution.assert_called_once_with(
+            session_id="sess", execution_id="exec-1", updates={"status": "paused"}
+        )
+        # AST run plus the DynamoDB status update both go through the executor
+        self.assertEqual(len(executed), 2)
+
     async def test_run_ast_unknown_name_raises(self) -> None:
         session = TN3270Session(
             session_id="sess",